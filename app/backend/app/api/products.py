@@ -5,7 +5,9 @@ This module defines all HTTP endpoints related to product operations.
 Each endpoint delegates business logic to the service layer.
 """
 
-from fastapi import APIRouter
+from typing import Annotated
+
+from fastapi import APIRouter, Header, Response, status
 
 from app.core.logging_config import StructuredLogger
 from app.models.product import ProductListResponse
@@ -17,9 +19,26 @@ router = APIRouter(prefix="/api/products", tags=["products"])
 # Initialize structured logger
 logger = StructuredLogger(__name__)
 
+# Let browsers and shared caches reuse the catalog briefly, then revalidate via ETag
+_PRODUCT_LIST_CACHE_CONTROL = "public, max-age=60"
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check whether an If-None-Match header value matches the given ETag."""
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Header may list several tags; If-None-Match uses weak comparison, which
+    # ignores the W/ prefix on both sides
+    opaque_tag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque_tag for candidate in if_none_match.split(","))
 
-@router.get("", response_model=ProductListResponse)
-async def get_products() -> ProductListResponse:
+
+# The schema is declared via `responses` rather than `response_model` so it is
+# documented in OpenAPI without FastAPI re-validating the response at runtime.
+@router.get("", responses={200: {"model": ProductListResponse}, 304: {"description": "Catalog not modified"}})
+async def get_products(if_none_match: Annotated[str | None, Header()] = None) -> Response:
     """
     Get all products from the catalog.
 
@@ -27,8 +46,17 @@ async def get_products() -> ProductListResponse:
     In the future, this endpoint will support filtering by price, category,
     and keyword search (that's what you'll be adding in the exercise!).
 
+    The response body is a ProductListResponse serialized once at startup by
+    the service layer, so no per-request validation or encoding happens here.
+    Responses carry an ETag; clients that send a matching If-None-Match header
+    get 304 Not Modified with no body.
+
+    Args:
+        if_none_match: ETag(s) from a previously cached response, if any
+
     Returns:
-        ProductListResponse containing list of products and total count
+        JSON response containing list of products and total count, or an
+        empty 304 response when the client's cached copy is current
 
     Example Response:
         {
@@ -46,13 +74,18 @@ async def get_products() -> ProductListResponse:
             "total_count": 30
         }
     """
-    logger.info("api_request_received", endpoint="/api/products", http_method="GET", operation="get_products")
+    etag = product_service.get_cached_response_etag()
+    cache_headers = {"ETag": etag, "Cache-Control": _PRODUCT_LIST_CACHE_CONTROL}
 
-    # Delegate to service layer for business logic
-    products = product_service.get_all_products()
+    # Client already has the current catalog - skip sending the body. GZipMiddleware
+    # adds Vary to the 200 but skips empty bodies, so the 304 declares it itself.
+    if _etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={**cache_headers, "Vary": "Accept-Encoding"},
+        )
 
-    logger.info(
-        "api_response_prepared", endpoint="/api/products", products_count=len(products), operation="get_products"
-    )
+    # Delegate to service layer for the pre-serialized catalog payload
+    response_body = product_service.get_cached_response_bytes()
 
-    return ProductListResponse(products=products, total_count=len(products))
+    return Response(content=response_body, media_type="application/json", headers=cache_headers)
@@ -15,12 +15,19 @@ class ApplicationSettings(BaseSettings):
         application_version: Semantic version number
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         enable_cors: Whether to enable CORS (Cross-Origin Resource Sharing)
+        cors_origins: Origins allowed to call the API from a browser; set via
+            JSON, e.g. CORS_ORIGINS='["https://shop.example.com"]'
+        enable_profiler: Whether to profile each request with pyinstrument and
+            report its duration in a Server-Timing header (requires the
+            `profiling` extra)
     """
 
     application_name: str = "Product Catalog API"
     application_version: str = "0.1.0"
     log_level: str = "INFO"
     enable_cors: bool = True
+    cors_origins: list[str] = ["http://localhost:3000"]
+    enable_profiler: bool = False
 
 
 # Global settings instance
@@ -13,12 +13,48 @@ Key principles for AI-friendly logging:
 5. Include fix_suggestion fields in error logs
 """
 
-import json
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from datetime import UTC, datetime
+import time
 from typing import Any
 
+import orjson
+
+# Level names accepted by setup_logging() (DEBUG, INFO, WARN/WARNING, ...), mapped
+# to stdlib level numbers. Copied once from the stdlib's own table.
+_LOG_LEVELS: dict[str, int] = logging.getLevelNamesMapping()
+
+# Last formatted whole second as (epoch_seconds, "YYYY-MM-DDTHH:MM:SS"). Log
+# records cluster within the same second, so the strftime result is reused.
+_last_timestamp_second: tuple[int, str] = (-1, "")
+
+
+def _format_utc_timestamp(created: float) -> str:
+    """
+    Format an epoch timestamp as an ISO 8601 UTC string with microseconds.
+
+    Microseconds are truncated, not rounded, so the result can be 1 µs earlier
+    than datetime.fromtimestamp(created, UTC). No datetime object is allocated
+    per log record.
+
+    Args:
+        created: Seconds since the epoch (e.g. LogRecord.created)
+
+    Returns:
+        Timestamp such as "2025-01-15T10:30:45.123456Z"
+    """
+    global _last_timestamp_second
+
+    seconds, microseconds = divmod(int(created * 1_000_000), 1_000_000)
+    cached_second, prefix = _last_timestamp_second
+    if seconds != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _last_timestamp_second = (seconds, prefix)
+    return f"{prefix}.{microseconds:06d}Z"
+
 
 class JsonFormatter(logging.Formatter):
     """
@@ -53,7 +89,8 @@ class JsonFormatter(logging.Formatter):
             JSON-formatted string representation of the log record
         """
         log_data: dict[str, Any] = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            # Use the creation time the stdlib already captured on the record
+            "timestamp": _format_utc_timestamp(record.created),
             "level": record.levelname,
             "logger_name": record.name,
             "message": record.getMessage(),
@@ -68,42 +105,139 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data, default=str)
+        # Extra fields may hold dicts keyed by ints or enums; stringify those keys
+        # like json.dumps would instead of failing the whole record
+        return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z).decode()
 
 
-def setup_logging(log_level: str = "INFO") -> None:
+def _parse_log_level(log_level: str) -> int:
+    """
+    Convert a log level name (case-insensitive) to its stdlib level number.
+
+    Args:
+        log_level: Level name such as "INFO", "warn" or "DEBUG"
+
+    Returns:
+        The numeric logging level
+
+    Raises:
+        ValueError: If the name is not a standard logging level
+    """
+    try:
+        return _LOG_LEVELS[log_level.upper()]
+    except KeyError:
+        valid_levels = ", ".join(_LOG_LEVELS)
+        raise ValueError(f"Unknown log level {log_level!r}; expected one of: {valid_levels}") from None
+
+
+def setup_logging(log_level: str = "INFO") -> logging.handlers.QueueListener:
     """
     Configure application-wide structured JSON logging to stdout.
 
     This function sets up all loggers to output JSON-formatted logs to stdout,
     making it easy for AI to read and understand application behavior.
 
+    Records are formatted to JSON on the calling thread and handed to a queue;
+    a background QueueListener thread does the blocking stdout writes, so
+    logging never stalls the asyncio event loop on a slow terminal or pipe.
+
     Args:
         log_level: The minimum log level to output (DEBUG, INFO, WARNING, ERROR, CRITICAL)
 
+    Returns:
+        The running QueueListener; pass it to shutdown_logging() on shutdown
+        and to start_logging() to resume afterwards
+
+    Raises:
+        ValueError: If log_level is not a standard logging level name
+
     Example:
-        >>> setup_logging("INFO")
+        >>> log_listener = setup_logging("INFO")
         >>> logger = logging.getLogger(__name__)
         >>> logger.info(
         ...     "Processing products",
         ...     extra={"total_products": 30, "filter_category": "electronics"}
         ... )
+        >>> shutdown_logging(log_listener)
     """
-    # Create JSON formatter
-    json_formatter = JsonFormatter()
+    level = _parse_log_level(log_level)
 
-    # Configure stdout handler
+    # Stdout handler only writes the already-formatted JSON line
     stdout_handler = logging.StreamHandler(sys.stdout)
-    stdout_handler.setFormatter(json_formatter)
+
+    # Background thread that drains the queue and writes to stdout
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    log_listener = logging.handlers.QueueListener(log_queue, stdout_handler)
 
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper()))
-    root_logger.addHandler(stdout_handler)
+    root_logger.setLevel(level)
 
     # Prevent duplicate logs from propagating
     root_logger.propagate = False
 
+    start_logging(log_listener)
+
+    return log_listener
+
+
+def _find_queue_handler(log_listener: logging.handlers.QueueListener) -> logging.handlers.QueueHandler | None:
+    """Return the root logger handler feeding the listener's queue, if attached."""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.handlers.QueueHandler) and handler.queue is log_listener.queue:
+            return handler
+    return None
+
+
+def start_logging(log_listener: logging.handlers.QueueListener) -> None:
+    """
+    Attach the listener's queue to the root logger and start its writer thread.
+
+    Does nothing if the listener is already running, so the application
+    lifespan can call it on every startup to resume logging after an earlier
+    shutdown_logging() (e.g. when several test clients reuse the same app).
+
+    Args:
+        log_listener: The listener returned by setup_logging()
+    """
+    # The listener runs exactly while its queue handler is attached to the root logger
+    if _find_queue_handler(log_listener) is not None:
+        return
+
+    # Queue handler formats records to JSON before enqueueing them, so exception
+    # details are rendered while the traceback is still attached. The handler level
+    # drops records propagated from more verbose child loggers before formatting.
+    root_logger = logging.getLogger()
+    queue_handler = logging.handlers.QueueHandler(log_listener.queue)
+    queue_handler.setLevel(root_logger.level)
+    queue_handler.setFormatter(JsonFormatter())
+
+    log_listener.start()
+    # Flush pending records at interpreter exit if shutdown_logging() never ran
+    atexit.register(log_listener.stop)
+    root_logger.addHandler(queue_handler)
+
+
+def shutdown_logging(log_listener: logging.handlers.QueueListener) -> None:
+    """
+    Flush queued log records and stop the background writer thread.
+
+    Detaches the listener's queue handler from the root logger first, so later
+    records fall back to the stdlib's last-resort stderr handler instead of
+    piling up in a queue nobody drains. Safe to call repeatedly; also cancels
+    the interpreter-exit flush. start_logging() resumes logging afterwards.
+
+    Args:
+        log_listener: The listener returned by setup_logging()
+    """
+    queue_handler = _find_queue_handler(log_listener)
+    if queue_handler is None:
+        return
+
+    logging.getLogger().removeHandler(queue_handler)
+    log_listener.stop()
+    atexit.unregister(log_listener.stop)
+
 
 def get_logger(logger_name: str) -> logging.Logger:
     """
@@ -161,12 +295,22 @@ class StructuredLogger:
     def __init__(self, logger_name: str):
         """Initialize with a logger name."""
         self._logger = logging.getLogger(logger_name)
+        self._name = self._logger.name
+
+        # Bind hot-path logger methods once instead of looking them up per call
+        self._is_enabled_for = self._logger.isEnabledFor
+        self._make_record = self._logger.makeRecord
+        self._handle = self._logger.handle
 
     def _log(self, level: int, message: str, **fields: Any) -> None:
         """Internal method to log with structured fields."""
+        # Skip building the record entirely when this level is filtered out
+        if not self._is_enabled_for(level):
+            return
+
         # Create a modified record that includes our fields
-        record = self._logger.makeRecord(
-            self._logger.name,
+        record = self._make_record(
+            self._name,
             level,
             "",  # pathname
             0,  # lineno
@@ -175,7 +319,7 @@ class StructuredLogger:
             None,  # exc_info
         )
         record.extra_fields = fields
-        self._logger.handle(record)
+        self._handle(record)
 
     def debug(self, message: str, **fields: Any) -> None:
         """Log a debug message with structured fields."""
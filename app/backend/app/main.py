@@ -5,18 +5,31 @@ This module initializes the FastAPI app, configures middleware,
 sets up logging, and registers all API routers.
 """
 
-from collections.abc import AsyncIterator
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api import products
 from app.core.config import settings
-from app.core.logging_config import StructuredLogger, setup_logging
+from app.core.logging_config import StructuredLogger, setup_logging, shutdown_logging, start_logging
 
-# Configure structured JSON logging
-setup_logging(log_level=settings.log_level)
+# Use uvloop's libuv-backed event loop when available (not supported on Windows).
+# This only affects runners that create their loop after importing this module;
+# uvicorn creates its loop first, so use --loop auto (the default) or --loop uvloop.
+# The startup log reports which loop is actually running.
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# Configure structured JSON logging (written to stdout by a background thread)
+log_listener = setup_logging(log_level=settings.log_level)
 
 # Initialize logger for this module
 logger = StructuredLogger(__name__)
@@ -36,13 +49,19 @@ async def application_lifespan(app: FastAPI) -> AsyncIterator[None]:
     Yields:
         None: Control flow during application runtime
     """
-    # Startup: Log application initialization
+    # Startup: Resume logging if an earlier shutdown stopped it (no-op otherwise)
+    start_logging(app.state.log_listener)
+
+    # Log application initialization, including the running loop implementation
+    # (e.g. "uvloop.Loop") so a fallback to the stdlib asyncio loop is visible
+    running_loop_type = type(asyncio.get_running_loop())
     logger.info(
         "application_startup",
         application_name=settings.application_name,
         application_version=settings.application_version,
         log_level=settings.log_level,
         cors_enabled=settings.enable_cors,
+        event_loop=f"{running_loop_type.__module__}.{running_loop_type.__qualname__}",
     )
 
     yield
@@ -50,6 +69,9 @@ async def application_lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Shutdown: Log application termination
     logger.info("application_shutdown", application_name=settings.application_name)
 
+    # Flush queued log records and stop the background writer thread
+    shutdown_logging(app.state.log_listener)
+
 
 # Create FastAPI application instance with lifespan handler
 app = FastAPI(
@@ -58,34 +80,63 @@ app = FastAPI(
     description="E-commerce product catalog API with filtering and search capabilities",
     lifespan=application_lifespan,
 )
+app.state.log_listener = log_listener
+
+# Compress larger JSON responses (e.g. the full product list) for clients that
+# accept gzip. Added before CORS so CORS wraps it and answers preflights itself.
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
 
 # Configure CORS (Cross-Origin Resource Sharing) if enabled
 if settings.enable_cors:
+    # Explicit allowlists are checked with constant-time lookups and avoid echoing
+    # arbitrary request headers back; the API is read-only and uses no cookies.
+    cors_allow_methods = ["GET"]
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],  # In production, specify exact origins
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_origins=settings.cors_origins,
+        allow_credentials=False,
+        allow_methods=cors_allow_methods,
+        allow_headers=["content-type", "if-none-match"],
     )
-    logger.info("cors_middleware_enabled", allow_origins="*", allow_methods="*")
+    logger.info("cors_middleware_enabled", allow_origins=settings.cors_origins, allow_methods=cors_allow_methods)
+
+# Profile every request with pyinstrument if enabled (ENABLE_PROFILER=true).
+# pyinstrument's async mode attributes time across await points correctly,
+# unlike cProfile. Registered last so it wraps all other middleware.
+if settings.enable_profiler:
+    from pyinstrument import Profiler
+
+    @app.middleware("http")
+    async def profile_request(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        """Profile a request and report its duration in a Server-Timing header."""
+        with Profiler(async_mode="enabled") as profiler:
+            response = await call_next(request)
+        response.headers["Server-Timing"] = f"total;dur={profiler.last_session.duration * 1000:.1f}"
+        return response
+
+    logger.info("profiler_middleware_enabled", profiler="pyinstrument")
 
 # Register API routers
 app.include_router(products.router)
 logger.info("api_router_registered", router_prefix="/api/products", router_tag="products")
 
 
+# Pre-encoded health check body; probes are frequent and the payload never changes
+_HEALTH_RESPONSE_BYTES = b'{"status":"healthy"}'
+
+
 @app.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> Response:
     """
     Health check endpoint for monitoring and load balancers.
 
+    Load balancers probe this route continuously, so it neither logs nor
+    serializes anything per request.
+
     Returns:
-        Dictionary with status indicating the application is running
+        JSON response with status indicating the application is running
 
     Example Response:
         {"status": "healthy"}
     """
-    logger.info("health_check_request", endpoint="/health")
-
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_RESPONSE_BYTES, media_type="application/json")
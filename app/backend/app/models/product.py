@@ -3,7 +3,7 @@
 from decimal import Decimal
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 # Define valid product categories as a type alias for reusability
 ProductCategory = Literal["electronics", "clothing", "home", "sports", "books"]
@@ -20,7 +20,8 @@ class Product(BaseModel):
         product_id: Unique identifier for the product
         product_name: Display name of the product
         product_description: Detailed description of the product
-        product_price_usd: Price in US dollars (uses Decimal for precision)
+        product_price_cents: Price in US cents (integer for exact, fast arithmetic)
+        product_price_usd: Price in US dollars (computed Decimal for precision)
         product_category: One of the predefined product categories
         product_in_stock: Whether the product is currently available
 
@@ -29,12 +30,15 @@ class Product(BaseModel):
         ...     product_id=1,
         ...     product_name="Wireless Mouse",
         ...     product_description="Ergonomic wireless mouse with USB receiver",
-        ...     product_price_usd=Decimal("29.99"),
+        ...     product_price_cents=2999,
         ...     product_category="electronics",
         ...     product_in_stock=True
         ... )
     """
 
+    # Catalog entries are shared read-only across requests
+    model_config = ConfigDict(frozen=True)
+
     product_id: int = Field(..., description="Unique product identifier", gt=0, examples=[1, 42, 1337])
 
     product_name: str = Field(
@@ -53,12 +57,12 @@ class Product(BaseModel):
         examples=["Ergonomic wireless mouse with USB receiver and long battery life"],
     )
 
-    product_price_usd: Decimal = Field(
+    product_price_cents: int = Field(
         ...,
-        description="Product price in US dollars (uses Decimal for monetary precision)",
+        description="Product price in US cents (integer for exact monetary arithmetic)",
         gt=0,
-        decimal_places=2,
-        examples=["29.99", "199.99", "9.99"],
+        exclude=True,
+        examples=[2999, 19999, 999],
     )
 
     product_category: ProductCategory = Field(
@@ -69,6 +73,15 @@ class Product(BaseModel):
 
     product_in_stock: bool = Field(default=True, description="Whether the product is currently available for purchase")
 
+    @computed_field(
+        description="Product price in US dollars (exact decimal, serialized as a string)",
+        examples=["29.99", "199.99", "9.99"],
+    )
+    @property
+    def product_price_usd(self) -> Decimal:
+        """Convert the integer price in cents to dollars (e.g. 2999 -> Decimal("29.99"))."""
+        return Decimal(self.product_price_cents).scaleb(-2)
+
 
 class ProductListResponse(BaseModel):
     """
@@ -89,6 +102,8 @@ class ProductListResponse(BaseModel):
         ... )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     products: list[Product] = Field(..., description="List of products matching the request criteria")
 
     total_count: int = Field(..., description="Total number of products in this response", ge=0)
@@ -5,26 +5,113 @@ This service layer separates business logic from API routing logic,
 making the code more testable and maintainable.
 """
 
+import hashlib
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+import orjson
+
 from app.core.logging_config import StructuredLogger
 from app.data.seed_products import get_seed_products
-from app.models.product import Product
+from app.models.product import Product, ProductCategory
 
 # Initialize structured logger for this module
 logger = StructuredLogger(__name__)
 
 # In-memory product storage (in a real app, this would be a database)
-_PRODUCTS_DATABASE: list[Product] = get_seed_products()
+_PRODUCTS_DATABASE: tuple[Product, ...] = get_seed_products()
+
+
+def _build_category_index() -> dict[ProductCategory, tuple[Product, ...]]:
+    """Group products by category, preserving catalog order within each group."""
+    products_by_category: defaultdict[ProductCategory, list[Product]] = defaultdict(list)
+    for product in _PRODUCTS_DATABASE:
+        products_by_category[product.product_category].append(product)
+    return {category: tuple(grouped) for category, grouped in products_by_category.items()}
+
+
+# Catalog positions ordered by ascending price
+_POSITIONS_BY_PRICE: list[int] = sorted(
+    range(len(_PRODUCTS_DATABASE)), key=lambda i: _PRODUCTS_DATABASE[i].product_price_cents
+)
+
+# Lookup indexes so filters use hash lookups and binary search instead of scans
+_PRODUCTS_BY_CATEGORY: dict[ProductCategory, tuple[Product, ...]] = _build_category_index()
+_PRODUCTS_BY_PRICE: tuple[Product, ...] = tuple(_PRODUCTS_DATABASE[i] for i in _POSITIONS_BY_PRICE)
+_SORTED_PRICES_CENTS: tuple[int, ...] = tuple(_PRODUCTS_DATABASE[i].product_price_cents for i in _POSITIONS_BY_PRICE)
+
+
+def _build_search_blob() -> tuple[bytes, tuple[int, ...]]:
+    """Join lowercased names and descriptions into one NUL-separated blob plus product start offsets."""
+    segments = [
+        f"{product.product_name}\x00{product.product_description}".lower().encode() for product in _PRODUCTS_DATABASE
+    ]
+    offsets = []
+    offset = 0
+    for segment in segments:
+        offsets.append(offset)
+        offset += len(segment) + 1
+    return b"\x00".join(segments), tuple(offsets)
+
+
+# Search index: every product's lowercase text in one bytes object, so keyword search
+# is a few C-level bytes.find calls instead of a Python loop over every product
+_SEARCH_BLOB, _SEARCH_OFFSETS = _build_search_blob()
+
+# JSON-ready dict for each product, in catalog order. The catalog is static, so
+# Pydantic serialization runs once here instead of on every request.
+_PRODUCTS_JSON: tuple[dict[str, Any], ...] = tuple(product.model_dump(mode="json") for product in _PRODUCTS_DATABASE)
+
+# Pre-encoded JSON object for each product, keyed by product ID. A product list
+# response is then just these fragments spliced into a fixed template.
+_PRODUCT_JSON_FRAGMENTS: dict[int, bytes] = {
+    product_json["product_id"]: orjson.dumps(product_json) for product_json in _PRODUCTS_JSON
+}
+
+
+def render_product_list(products: Iterable[Product]) -> bytes:
+    """
+    Encode products as a ProductListResponse JSON body from cached fragments.
+
+    The response always has the same keys in the same order, so instead of
+    running a generic encoder it joins the per-product JSON fragments that
+    were encoded at import time. The output is byte-for-byte what
+    orjson.dumps would produce for the equivalent ProductListResponse dict.
+
+    Args:
+        products: Catalog products to include, in response order
+
+    Returns:
+        JSON-encoded ProductListResponse
+
+    Example:
+        >>> render_product_list(get_products_by_category("books"))[:13]
+        b'{"products":['
+    """
+    fragments = [_PRODUCT_JSON_FRAGMENTS[product.product_id] for product in products]
+    return b'{"products":[%b],"total_count":%d}' % (b",".join(fragments), len(fragments))
 
 
-def get_all_products() -> list[Product]:
+# Pre-encoded JSON body for the unfiltered product list
+_CACHED_RESPONSE_BYTES: bytes = render_product_list(_PRODUCTS_DATABASE)
+
+# Weak HTTP entity tag for the cached body, so clients can revalidate with If-None-Match.
+# Weak because GZipMiddleware may re-encode the body without changing the tag, and
+# the gzip and identity representations are not byte-for-byte identical.
+_CACHED_RESPONSE_ETAG: str = f'W/"{hashlib.sha256(_CACHED_RESPONSE_BYTES).hexdigest()[:16]}"'
+
+
+def get_all_products() -> tuple[Product, ...]:
     """
     Retrieve all products from the catalog.
 
     This function returns all available products without any filtering.
-    It logs the operation for debugging and monitoring purposes.
+    It logs the operation at DEBUG level for troubleshooting.
 
     Returns:
-        List of all Product objects in the catalog
+        Tuple of all Product objects in the catalog
 
     Example:
         >>> products = get_all_products()
@@ -33,12 +120,169 @@ def get_all_products() -> list[Product]:
         >>> products[0].product_name
         'Wireless Bluetooth Mouse'
     """
-    logger.info(
-        "retrieving_all_products", total_products_in_database=len(_PRODUCTS_DATABASE), operation="get_all_products"
+    logger.debug("products_retrieved", products_returned=len(_PRODUCTS_DATABASE), operation="get_all_products")
+
+    return _PRODUCTS_DATABASE
+
+
+def get_cached_response_bytes() -> bytes:
+    """
+    Retrieve the pre-serialized JSON body for the full product list.
+
+    The bytes are a ProductListResponse containing every product, encoded once
+    at import time so the API can return them without re-running Pydantic
+    validation and JSON serialization on every request.
+
+    Returns:
+        JSON-encoded ProductListResponse for all products in the catalog
+
+    Example:
+        >>> body = get_cached_response_bytes()
+        >>> body.startswith(b'{"products":[')
+        True
+    """
+    return _CACHED_RESPONSE_BYTES
+
+
+def get_cached_response_etag() -> str:
+    """
+    Retrieve the HTTP ETag for the pre-serialized product list body.
+
+    The tag is a truncated SHA-256 of the bytes returned by
+    get_cached_response_bytes(), so it changes whenever the catalog does.
+
+    Returns:
+        Weak entity tag suitable for the ETag response header
+
+    Example:
+        >>> get_cached_response_etag().startswith('W/"')
+        True
+    """
+    return _CACHED_RESPONSE_ETAG
+
+
+def get_products_by_category(category: ProductCategory) -> tuple[Product, ...]:
+    """
+    Retrieve all products in a single category.
+
+    Uses a category index built at import time, so the lookup does not scan
+    the whole catalog.
+
+    Args:
+        category: Product category to look up
+
+    Returns:
+        Tuple of products in the category, in catalog order (empty if none)
+
+    Example:
+        >>> len(get_products_by_category("electronics"))
+        8
+    """
+    products = _PRODUCTS_BY_CATEGORY.get(category, ())
+
+    logger.debug(
+        "products_retrieved_by_category",
+        filter_category=category,
+        products_returned=len(products),
+        operation="get_products_by_category",
     )
 
-    logger.info(
-        "products_retrieved_successfully", products_returned=len(_PRODUCTS_DATABASE), operation="get_all_products"
+    return products
+
+
+def get_products_in_price_range(
+    min_price_cents: int | None = None, max_price_cents: int | None = None
+) -> tuple[Product, ...]:
+    """
+    Retrieve products whose price falls within an inclusive range.
+
+    Uses binary search over products pre-sorted by price, so only the
+    matching slice is touched.
+
+    Args:
+        min_price_cents: Minimum price in cents (inclusive), or None for no lower bound
+        max_price_cents: Maximum price in cents (inclusive), or None for no upper bound
+
+    Returns:
+        Tuple of matching products, ordered by ascending price
+
+    Example:
+        >>> products = get_products_in_price_range(min_price_cents=10000)
+        >>> all(p.product_price_cents >= 10000 for p in products)
+        True
+    """
+    start = 0 if min_price_cents is None else bisect_left(_SORTED_PRICES_CENTS, min_price_cents)
+    end = len(_SORTED_PRICES_CENTS) if max_price_cents is None else bisect_right(_SORTED_PRICES_CENTS, max_price_cents)
+    products = _PRODUCTS_BY_PRICE[start:end]
+
+    logger.debug(
+        "products_retrieved_by_price_range",
+        min_price_cents=min_price_cents,
+        max_price_cents=max_price_cents,
+        products_returned=len(products),
+        operation="get_products_in_price_range",
     )
 
-    return _PRODUCTS_DATABASE
+    return products
+
+
+def _find_keyword_positions(search_keyword: str) -> list[int]:
+    """
+    Find catalog positions of products whose name or description contains a keyword.
+
+    Args:
+        search_keyword: Keyword to look for (matched case-insensitively)
+
+    Returns:
+        Ascending catalog positions of matching products
+    """
+    if not search_keyword:
+        return list(range(len(_SEARCH_OFFSETS)))
+    # NUL separates fields in the blob; real names and descriptions never contain it
+    if "\x00" in search_keyword:
+        return []
+
+    needle = search_keyword.lower().encode()
+    positions = []
+    match_offset = _SEARCH_BLOB.find(needle)
+    while match_offset != -1:
+        # Map the byte offset back to the product whose segment contains it
+        position = bisect_right(_SEARCH_OFFSETS, match_offset) - 1
+        positions.append(position)
+        if position + 1 == len(_SEARCH_OFFSETS):
+            break
+        # Resume at the next product so each product is reported once
+        match_offset = _SEARCH_BLOB.find(needle, _SEARCH_OFFSETS[position + 1])
+    return positions
+
+
+async def search_products(search_keyword: str) -> tuple[Product, ...]:
+    """
+    Search products by keyword in their name or description (case-insensitive).
+
+    The scan runs inline on the event loop. The search blob is about 3 KB, so
+    a scan takes microseconds, less than handing it to a thread or process.
+    bytes.find also holds the GIL, so a thread would not free the loop anyway.
+
+    Args:
+        search_keyword: Keyword to search for
+
+    Returns:
+        Tuple of matching products, in catalog order
+
+    Example:
+        >>> products = await search_products("wireless")
+        >>> products[0].product_name
+        'Wireless Bluetooth Mouse'
+    """
+    positions = _find_keyword_positions(search_keyword)
+    products = tuple(_PRODUCTS_DATABASE[position] for position in positions)
+
+    logger.debug(
+        "products_searched",
+        search_keyword=search_keyword,
+        products_returned=len(products),
+        operation="search_products",
+    )
+
+    return products
@@ -3,6 +3,10 @@ Development server runner for the product catalog API.
 
 Run this script to start the development server:
     python run_api.py
+
+Uvicorn automatically uses uvloop and httptools when they are installed.
+To pin them explicitly (e.g. in production), run uvicorn directly:
+    uvicorn app.main:app --loop uvloop --http httptools
 """
 
 import uvicorn
@@ -4,22 +4,164 @@ Pytest configuration and shared test fixtures.
 This module provides reusable test fixtures for all test files.
 """
 
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+
 from app.main import app
+from tests.helpers import AsgiResponse, RawAsgiGet, decode_json
+
+# Skip reason used by exercise stubs that have no implementation yet
+UNIMPLEMENTED_SKIP_REASON_PREFIX = "Not implemented"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the --run-unimplemented command line option."""
+    parser.addoption(
+        "--run-unimplemented",
+        action="store_true",
+        default=False,
+        help="Collect exercise stub tests that are still skipped as 'Not implemented'",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """
+    Deselect exercise stubs that are skipped as not implemented yet.
+
+    Those tests would only be reported as skipped, so they are dropped at
+    collection time unless --run-unimplemented is passed. Once you remove
+    a stub's skip marker it is collected and run as normal.
+    """
+    if config.getoption("--run-unimplemented"):
+        return
+
+    selected: list[pytest.Item] = []
+    deselected: list[pytest.Item] = []
+    for item in items:
+        skip_marker = item.get_closest_marker("skip")
+        reason = "" if skip_marker is None else str(skip_marker.kwargs.get("reason", ""))
+        if reason.startswith(UNIMPLEMENTED_SKIP_REASON_PREFIX):
+            deselected.append(item)
+        else:
+            selected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(scope="session")
+async def test_client() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Provide an async HTTP client that calls the FastAPI app in-process.
+
+    Requests go straight to the ASGI app through httpx's ASGITransport, so
+    no server or socket is involved and independent requests can run
+    concurrently on the event loop. The client is shared by the whole test
+    session and the app's lifespan (startup and shutdown) runs exactly once.
+    Tests must not mutate app state.
+
+    Yields:
+        httpx.AsyncClient instance bound to the FastAPI app
+
+    Example:
+        async def test_get_products(test_client):
+            response = await test_client.get("/api/products")
+            assert response.status_code == 200
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=transport, base_url="http://testserver") as client,
+    ):
+        yield client
+
+
+@pytest.fixture(scope="session")
+async def all_products_response(test_client: httpx.AsyncClient) -> tuple[int, dict[str, Any]]:
+    """
+    Provide the unfiltered GET /api/products response, fetched once per session.
+
+    Tests that only inspect the full catalog share this instead of each
+    issuing the same request and decoding the same JSON.
+
+    Returns:
+        Tuple of (HTTP status code, decoded JSON body)
+
+    Example:
+        async def test_products_count(all_products_response):
+            status_code, data = all_products_response
+            assert data["total_count"] == 30
+    """
+    response = await test_client.get("/api/products")
+    return response.status_code, decode_json(response)
 
 
-@pytest.fixture
-def test_client() -> TestClient:
+@pytest.fixture(scope="session")
+def raw_asgi_get(test_client: httpx.AsyncClient) -> RawAsgiGet:
     """
-    Provide a FastAPI TestClient for making HTTP requests in tests.
+    Provide a function that sends a GET request straight to the ASGI app.
+
+    It builds the ASGI scope by hand and collects the response messages,
+    skipping httpx's URL parsing, request/response objects and header
+    handling. Use it for simple, frequently-run GET checks; use test_client
+    when a test needs custom headers or a full HTTP response. Depends on
+    test_client so the app's lifespan has started before the first call.
 
     Returns:
-        TestClient instance configured with the FastAPI app
+        Async function taking (path, query_string="") and returning an AsgiResponse
 
     Example:
-        def test_get_products(test_client):
-            response = test_client.get("/api/products")
+        async def test_health(raw_asgi_get):
+            response = await raw_asgi_get("/health")
             assert response.status_code == 200
     """
-    return TestClient(app)
+
+    async def get(path: str, query_string: str = "") -> AsgiResponse:
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": query_string.encode(),
+            "headers": [(b"host", b"testserver")],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+        }
+        response_complete = asyncio.Event()
+        request_sent = False
+        status_code = 0
+        headers: list[tuple[str, str]] = []
+        body_parts: list[bytes] = []
+
+        async def receive() -> dict[str, Any]:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # Anything listening for a disconnect waits until the response is done
+            await response_complete.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers.extend((name.decode("latin-1"), value.decode("latin-1")) for name, value in message["headers"])
+            elif message["type"] == "http.response.body":
+                body_parts.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    response_complete.set()
+
+        await app(scope, receive, send)
+        return AsgiResponse(status_code=status_code, headers=headers, content=b"".join(body_parts))
+
+    return get
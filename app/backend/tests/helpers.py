@@ -0,0 +1,54 @@
+"""
+Shared test helpers.
+
+Plain types and functions used by conftest.py fixtures and test modules.
+Fixtures live in conftest.py; import these directly from tests.helpers.
+"""
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+import orjson
+
+
+@dataclass(frozen=True)
+class AsgiResponse:
+    """
+    Minimal HTTP response captured from a direct ASGI call.
+
+    Attribute names mirror httpx.Response, so helpers like decode_json()
+    accept either. Headers are kept as raw (name, value) pairs in the order
+    the app sent them, so repeated headers such as Set-Cookie or Vary are
+    not collapsed.
+    """
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+
+
+# Signature of the raw_asgi_get fixture: (path, query_string) -> response
+RawAsgiGet = Callable[..., Awaitable[AsgiResponse]]
+
+
+def decode_json(response: httpx.Response | AsgiResponse) -> Any:
+    """
+    Decode a response body as JSON using orjson.
+
+    orjson parses noticeably faster than httpx's stdlib-based Response.json(),
+    which adds up across tests that decode the full product catalog.
+
+    Args:
+        response: HTTP response with a JSON body
+
+    Returns:
+        The decoded JSON value
+
+    Example:
+        from tests.helpers import decode_json
+
+        data = decode_json(await test_client.get("/api/products"))
+    """
+    return orjson.loads(response.content)
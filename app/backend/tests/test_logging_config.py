@@ -0,0 +1,60 @@
+"""
+Tests for the structured logging setup.
+
+These tests drive the logging setup functions directly to verify level
+parsing and that the background writer can be stopped and restarted.
+"""
+
+import logging
+import logging.handlers
+
+import pytest
+
+from app.core.logging_config import _parse_log_level, setup_logging, shutdown_logging, start_logging
+
+
+def count_queue_handlers(log_listener: logging.handlers.QueueListener) -> int:
+    """Count root logger handlers that feed the given listener's queue."""
+    return sum(
+        isinstance(handler, logging.handlers.QueueHandler) and handler.queue is log_listener.queue
+        for handler in logging.getLogger().handlers
+    )
+
+
+def test_logging_can_be_shut_down_twice_and_restarted(capsys: pytest.CaptureFixture[str]) -> None:
+    """
+    Test that the logging lifecycle is idempotent and restartable.
+
+    Several test clients may run the app lifespan against the same listener,
+    so repeated shutdowns must not raise and a later startup must resume
+    writing records instead of dropping them.
+    """
+    log_listener = setup_logging("INFO")
+    assert count_queue_handlers(log_listener) == 1
+
+    shutdown_logging(log_listener)
+    shutdown_logging(log_listener)
+    assert count_queue_handlers(log_listener) == 0
+
+    start_logging(log_listener)
+    start_logging(log_listener)
+    assert count_queue_handlers(log_listener) == 1
+
+    logging.getLogger("tests.logging").info("logged_after_restart")
+    shutdown_logging(log_listener)
+
+    assert '"message":"logged_after_restart"' in capsys.readouterr().out
+
+
+def test_parse_log_level_accepts_stdlib_aliases_and_rejects_unknown_names() -> None:
+    """
+    Test that log level names follow the stdlib table, aliases included.
+
+    LOG_LEVEL=warn must work like it does with the stdlib, and a typo must
+    fail with a message listing the valid names instead of a bare KeyError.
+    """
+    assert _parse_log_level("warn") == logging.WARNING
+    assert _parse_log_level("FATAL") == logging.CRITICAL
+
+    with pytest.raises(ValueError, match=r"expected one of: .*WARNING"):
+        _parse_log_level("VERBOSE")
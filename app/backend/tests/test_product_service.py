@@ -0,0 +1,88 @@
+"""
+Tests for the product service layer.
+
+These tests call the service functions directly (no HTTP) to verify the
+lookup indexes built from the seed data.
+"""
+
+import json
+
+from app.models.product import Product, ProductListResponse
+from app.services import product_service
+
+
+def test_seed_products_pass_validation() -> None:
+    """
+    Test that every seed product satisfies the Product model's validation rules.
+
+    Seed products are built with model_construct (no validation) for speed,
+    so this guards against invalid literals slipping into the seed data.
+    """
+    for product in product_service.get_all_products():
+        assert Product.model_validate(dict(product)) == product
+
+
+def test_get_products_by_category_returns_only_that_category() -> None:
+    """
+    Test that the category index returns every product in the category.
+
+    We have 8 electronics products in seed data (IDs 1-8).
+    """
+    products = product_service.get_products_by_category("electronics")
+
+    assert len(products) == 8
+    assert all(product.product_category == "electronics" for product in products)
+
+
+def test_get_products_in_price_range_is_inclusive() -> None:
+    """
+    Test that price range lookups include products exactly on the bounds.
+
+    "Wireless Bluetooth Mouse" costs $29.99 and "Ceramic Non-Stick Frying Pan"
+    costs $49.99, so both should be returned for a $29.99-$49.99 range.
+    """
+    products = product_service.get_products_in_price_range(min_price_cents=2999, max_price_cents=4999)
+    product_names = {product.product_name for product in products}
+
+    assert "Wireless Bluetooth Mouse" in product_names
+    assert "Ceramic Non-Stick Frying Pan" in product_names
+    assert all(2999 <= product.product_price_cents <= 4999 for product in products)
+
+
+def test_get_products_in_price_range_without_bounds_returns_all_products() -> None:
+    """
+    Test that omitting both bounds returns the whole catalog.
+    """
+    products = product_service.get_products_in_price_range()
+
+    assert len(products) == len(product_service.get_all_products())
+
+
+async def test_search_products_matches_name_or_description_case_insensitively() -> None:
+    """
+    Test keyword search across product names and descriptions.
+
+    "Wireless Bluetooth Mouse" has the keyword in its name; every match must
+    contain it (in any case) in either the name or the description.
+    """
+    products = await product_service.search_products("WIRELESS")
+    product_names = {product.product_name for product in products}
+
+    assert "Wireless Bluetooth Mouse" in product_names
+    for product in products:
+        assert "wireless" in product.product_name.lower() or "wireless" in product.product_description.lower()
+
+
+def test_render_product_list_matches_pydantic_serialization() -> None:
+    """
+    Test that the fragment-based encoder produces the same JSON as Pydantic.
+
+    Rendering a subset of the catalog must decode to exactly what
+    ProductListResponse would serialize for the same products.
+    """
+    products = product_service.get_products_by_category("books")
+
+    rendered = json.loads(product_service.render_product_list(products))
+    expected = ProductListResponse(products=list(products), total_count=len(products)).model_dump(mode="json")
+
+    assert rendered == expected
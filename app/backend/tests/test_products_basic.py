@@ -6,95 +6,116 @@ They demonstrate the testing pattern you should follow when implementing
 the filtering functionality.
 """
 
-from fastapi.testclient import TestClient
+from typing import Any
 
+import httpx
 
-def test_get_all_products_returns_200(test_client: TestClient) -> None:
-    """
-    Test that GET /api/products returns HTTP 200 status code.
-
-    This is the most basic test - just checking the endpoint is reachable
-    and returns a successful response.
-    """
-    response = test_client.get("/api/products")
+from tests.helpers import RawAsgiGet, decode_json
 
-    assert response.status_code == 200
+# Fields every product object in an API response must have
+REQUIRED_PRODUCT_FIELDS = frozenset(
+    {
+        "product_id",
+        "product_name",
+        "product_description",
+        "product_price_usd",
+        "product_category",
+        "product_in_stock",
+    }
+)
 
 
-def test_get_all_products_returns_correct_structure(test_client: TestClient) -> None:
+async def test_get_all_products_contract(all_products_response: tuple[int, dict[str, Any]]) -> None:
     """
-    Test that GET /api/products returns the expected JSON structure.
-
-    The response should have:
-    - "products": list of product objects
-    - "total_count": integer count of products
+    Test the full contract of GET /api/products with no filters.
+
+    Checks, in order:
+    - HTTP 200 status code (the endpoint is reachable)
+    - JSON structure: "products" list and integer "total_count"
+    - All 30 seed products are returned when no filters are applied
+    - Product objects have every required field (spot check on the first):
+      product_id, product_name, product_description, product_price_usd,
+      product_category, product_in_stock
     """
-    response = test_client.get("/api/products")
-    data = response.json()
+    status_code, data = all_products_response
+
+    # Verify the endpoint responds successfully
+    assert status_code == 200
 
-    # Verify response structure
-    assert "products" in data
-    assert "total_count" in data
+    # Verify response structure and types
+    assert isinstance(data.get("products"), list)
+    assert isinstance(data.get("total_count"), int)
+
+    # Verify all seed products are returned
+    products = data["products"]
+    assert data["total_count"] == 30
+    assert len(products) == 30
 
-    # Verify types
-    assert isinstance(data["products"], list)
-    assert isinstance(data["total_count"], int)
+    # Verify product objects have all required fields
+    assert REQUIRED_PRODUCT_FIELDS.issubset(products[0])
 
 
-def test_get_all_products_returns_30_products(test_client: TestClient) -> None:
+async def test_get_all_products_is_gzip_compressed(test_client: httpx.AsyncClient) -> None:
     """
-    Test that GET /api/products returns all 30 seed products.
+    Test that the product list is gzip-compressed when the client accepts it.
 
-    Since we have 30 products in our seed data, we should get all of them
-    when no filters are applied.
+    The full catalog is well above the compression threshold, so it should
+    come back with Content-Encoding: gzip and still decode to 30 products.
     """
-    response = test_client.get("/api/products")
-    data = response.json()
+    response = await test_client.get("/api/products", headers={"Accept-Encoding": "gzip"})
 
-    assert data["total_count"] == 30
-    assert len(data["products"]) == 30
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(decode_json(response)["products"]) == 30
 
 
-def test_product_objects_have_required_fields(test_client: TestClient) -> None:
+async def test_get_all_products_returns_304_for_matching_etag(test_client: httpx.AsyncClient) -> None:
     """
-    Test that each product object contains all required fields.
-
-    Every product should have:
-    - product_id
-    - product_name
-    - product_description
-    - product_price_usd
-    - product_category
-    - product_in_stock
+    Test that GET /api/products supports conditional requests.
+
+    The first response carries a weak ETag. Sending it back in If-None-Match
+    should return 304 Not Modified with an empty body and the same Vary header.
     """
-    response = test_client.get("/api/products")
-    data = response.json()
+    first_response = await test_client.get("/api/products")
+    etag = first_response.headers["etag"]
+    assert etag.startswith('W/"')
 
-    products = data["products"]
-    assert len(products) > 0  # Make sure we have products to test
+    response = await test_client.get("/api/products", headers={"If-None-Match": etag})
 
-    # Check first product has all fields (spot check)
-    first_product = products[0]
-    required_fields = [
-        "product_id",
-        "product_name",
-        "product_description",
-        "product_price_usd",
-        "product_category",
-        "product_in_stock"
-    ]
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert "Accept-Encoding" in first_response.headers["vary"]
+    assert response.headers["vary"] == first_response.headers["vary"]
+
+
+async def test_cors_preflight_allows_frontend_origin(test_client: httpx.AsyncClient) -> None:
+    """
+    Test that the frontend dev server origin passes a CORS preflight request.
 
-    for field in required_fields:
-        assert field in first_product
+    The frontend (http://localhost:3000) sends GET requests with a
+    Content-Type header, so the browser issues a preflight first.
+    """
+    response = await test_client.options(
+        "/api/products",
+        headers={
+            "Origin": "http://localhost:3000",
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "content-type",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
 
 
-def test_health_check_endpoint(test_client: TestClient) -> None:
+async def test_health_check_endpoint(raw_asgi_get: RawAsgiGet) -> None:
     """
     Test that the /health endpoint works correctly.
 
     This is a simple sanity check to ensure the app is running.
     """
-    response = test_client.get("/health")
+    response = await raw_asgi_get("/health")
 
     assert response.status_code == 200
-    assert response.json() == {"status": "healthy"}
+    # The body is a fixed literal, so compare raw bytes instead of decoding JSON
+    assert response.content == b'{"status":"healthy"}'
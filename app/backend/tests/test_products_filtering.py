@@ -4,145 +4,100 @@ Tests for product filtering functionality.
 These tests are currently STUBS - they will fail until you implement
 the filtering functionality. Your goal is to make all these tests pass!
 
+Stubs still marked as skipped are deselected by default. To list them in
+the run (as skipped), pass --run-unimplemented. Once you remove a stub's
+skip marker it runs as normal.
+
 Run these tests with:
     pytest tests/test_products_filtering.py -v
 """
 
+import operator
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
 
+from tests.helpers import RawAsgiGet, decode_json
 
-@pytest.mark.skip(reason="Not implemented yet - this is your exercise!")
-def test_filter_products_by_minimum_price(test_client: TestClient) -> None:
-    """
-    Test filtering products by minimum price.
+get_product_category = operator.itemgetter("product_category")
+get_product_text = operator.itemgetter("product_name", "product_description")
 
-    When min_price_usd=100 is provided, only products costing $100 or more
-    should be returned.
 
-    Expected: Should return products like "Wireless Earbuds Pro" ($149.99),
-    "Smart Robot Vacuum" ($299.99), "Adjustable Dumbbell Set" ($499.99), etc.
-    """
-    response = test_client.get("/api/products?min_price_usd=100")
-    data = response.json()
+def is_in_category(category: str, product: dict[str, Any]) -> bool:
+    """Check whether a product JSON object belongs to the given category."""
+    return get_product_category(product) == category
 
-    assert response.status_code == 200
-    assert all(
-        float(product["product_price_usd"]) >= 100
-        for product in data["products"]
-    )
 
+def mentions_keyword(keyword: str, product: dict[str, Any]) -> bool:
+    """Check whether a product's name or description contains a lowercase keyword."""
+    return any(keyword in text.lower() for text in get_product_text(product))
 
-@pytest.mark.skip(reason="Not implemented yet - this is your exercise!")
-def test_filter_products_by_maximum_price(test_client: TestClient) -> None:
-    """
-    Test filtering products by maximum price.
 
-    When max_price_usd=30 is provided, only products costing $30 or less
-    should be returned.
+# Reusable predicates, built once at import time
+IS_ELECTRONICS = partial(is_in_category, "electronics")
+MENTIONS_WIRELESS = partial(mentions_keyword, "wireless")
 
-    Expected: Should return products like "Smart LED Light Bulb" ($19.99),
-    "Classic Cotton T-Shirt" ($24.99), "Merino Wool Beanie" ($29.99), etc.
-    """
-    response = test_client.get("/api/products?max_price_usd=30")
-    data = response.json()
-
-    assert response.status_code == 200
-    assert all(
-        float(product["product_price_usd"]) <= 30
-        for product in data["products"]
-    )
+# Each case: (query string, inclusive price bounds in USD (None = unbounded),
+# predicate for non-price conditions (None = none), expected number of
+# products or None if only the bounds/predicate are checked)
+FILTER_CASES = [
+    # Products like "Wireless Earbuds Pro" ($149.99), "Smart Robot Vacuum" ($299.99)
+    pytest.param("min_price_usd=100", 100, None, None, None, id="minimum_price"),
+    # Products like "Smart LED Light Bulb" ($19.99), "Classic Cotton T-Shirt" ($24.99)
+    pytest.param("max_price_usd=30", None, 30, None, None, id="maximum_price"),
+    # Products like "Wireless Bluetooth Mouse" ($29.99), "USB-C Hub 7-in-1" ($45.99)
+    pytest.param("min_price_usd=25&max_price_usd=50", 25, 50, None, None, id="price_range"),
+    # We have 8 electronics products in seed data (IDs 1-8)
+    pytest.param("category=electronics", None, None, IS_ELECTRONICS, 8, id="category"),
+    # Case-insensitive match in name or description, e.g. "Wireless Earbuds Pro"
+    pytest.param("search_keyword=wireless", None, None, MENTIONS_WIRELESS, None, id="search_keyword"),
+    # Electronics costing $50 or less, e.g. "Smart LED Light Bulb" ($19.99)
+    pytest.param("category=electronics&max_price_usd=50", None, 50, IS_ELECTRONICS, None, id="multiple_parameters"),
+]
 
 
 @pytest.mark.skip(reason="Not implemented yet - this is your exercise!")
-def test_filter_products_by_price_range(test_client: TestClient) -> None:
-    """
-    Test filtering products by both minimum and maximum price.
-
-    When min_price_usd=25 and max_price_usd=50 are provided, only products
-    in that price range should be returned.
-
-    Expected: Should return products like "Wireless Bluetooth Mouse" ($29.99),
-    "USB-C Hub 7-in-1" ($45.99), "Ceramic Non-Stick Frying Pan" ($49.99), etc.
-    """
-    response = test_client.get("/api/products?min_price_usd=25&max_price_usd=50")
-    data = response.json()
+@pytest.mark.parametrize(
+    ("query_string", "min_price_usd", "max_price_usd", "product_predicate", "expected_count"), FILTER_CASES
+)
+async def test_filter_products(
+    raw_asgi_get: RawAsgiGet,
+    query_string: str,
+    min_price_usd: float | None,
+    max_price_usd: float | None,
+    product_predicate: Callable[[dict[str, Any]], bool] | None,
+    expected_count: int | None,
+) -> None:
+    """
+    Test filtering products by price, category, and keyword.
+
+    Each case sends one combination of filter parameters and checks that
+    every returned product matches it (and, where known, how many match).
+    """
+    response = await raw_asgi_get("/api/products", query_string)
+    data = decode_json(response)
+    products = data["products"]
 
     assert response.status_code == 200
-    assert all(
-        25 <= float(product["product_price_usd"]) <= 50
-        for product in data["products"]
-    )
-
 
-@pytest.mark.skip(reason="Not implemented yet - this is your exercise!")
-def test_filter_products_by_category(test_client: TestClient) -> None:
-    """
-    Test filtering products by category.
+    # Parse prices once, then check the bounds against the extremes
+    prices = [float(product["product_price_usd"]) for product in products]
+    if min_price_usd is not None:
+        assert min(prices, default=min_price_usd) >= min_price_usd
+    if max_price_usd is not None:
+        assert max(prices, default=max_price_usd) <= max_price_usd
 
-    When category=electronics is provided, only electronics products
-    should be returned.
-
-    Expected: Should return 8 electronics products (IDs 1-8).
-    """
-    response = test_client.get("/api/products?category=electronics")
-    data = response.json()
-
-    assert response.status_code == 200
-    assert all(
-        product["product_category"] == "electronics"
-        for product in data["products"]
-    )
-    # We have 8 electronics products in seed data
-    assert len(data["products"]) == 8
-
-
-@pytest.mark.skip(reason="Not implemented yet - this is your exercise!")
-def test_search_products_by_keyword(test_client: TestClient) -> None:
-    """
-    Test searching products by keyword.
-
-    When search_keyword=wireless is provided, only products with "wireless"
-    in their name or description should be returned (case-insensitive).
-
-    Expected: Should return "Wireless Bluetooth Mouse", "Wireless Earbuds Pro",
-    "Wireless Charger Stand", etc.
-    """
-    response = test_client.get("/api/products?search_keyword=wireless")
-    data = response.json()
-
-    assert response.status_code == 200
-    # All returned products should have "wireless" in name or description
-    for product in data["products"]:
-        name_lower = product["product_name"].lower()
-        desc_lower = product["product_description"].lower()
-        assert "wireless" in name_lower or "wireless" in desc_lower
+    if product_predicate is not None:
+        assert all(product_predicate(product) for product in products)
+    if expected_count is not None:
+        assert len(products) == expected_count
 
 
 @pytest.mark.skip(reason="Not implemented yet - this is your exercise!")
-def test_filter_with_multiple_parameters(test_client: TestClient) -> None:
-    """
-    Test filtering with multiple parameters combined.
-
-    When category=electronics AND max_price_usd=50 are provided, only
-    electronics products costing $50 or less should be returned.
-
-    Expected: Should return products like "Wireless Bluetooth Mouse" ($29.99),
-    "USB-C Hub 7-in-1" ($45.99), "Smart LED Light Bulb" ($19.99), etc.
-    """
-    response = test_client.get("/api/products?category=electronics&max_price_usd=50")
-    data = response.json()
-
-    assert response.status_code == 200
-    assert all(
-        product["product_category"] == "electronics" and
-        float(product["product_price_usd"]) <= 50
-        for product in data["products"]
-    )
-
-
-@pytest.mark.skip(reason="Not implemented yet - this is your exercise!")
-def test_invalid_price_range_returns_400(test_client: TestClient) -> None:
+async def test_invalid_price_range_returns_400(test_client: httpx.AsyncClient) -> None:
     """
     Test that invalid price range (min > max) returns HTTP 400 error.
 
@@ -157,8 +112,8 @@ def test_invalid_price_range_returns_400(test_client: TestClient) -> None:
         "timestamp_utc": "..."
     }
     """
-    response = test_client.get("/api/products?min_price_usd=100&max_price_usd=50")
-    data = response.json()
+    response = await test_client.get("/api/products?min_price_usd=100&max_price_usd=50")
+    data = decode_json(response)
 
     assert response.status_code == 400
     assert "error_code" in data
@@ -166,7 +121,7 @@ def test_invalid_price_range_returns_400(test_client: TestClient) -> None:
 
 
 @pytest.mark.skip(reason="Not implemented yet - this is your exercise!")
-def test_no_filters_returns_all_products(test_client: TestClient) -> None:
+async def test_no_filters_returns_all_products(all_products_response: tuple[int, dict[str, Any]]) -> None:
     """
     Test that when no filters are provided, all products are returned.
 
@@ -175,9 +130,8 @@ def test_no_filters_returns_all_products(test_client: TestClient) -> None:
 
     Expected: Should return all 30 products.
     """
-    response = test_client.get("/api/products")
-    data = response.json()
+    status_code, data = all_products_response
 
-    assert response.status_code == 200
+    assert status_code == 200
     assert data["total_count"] == 30
     assert len(data["products"]) == 30